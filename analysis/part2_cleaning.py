@@ -1,132 +1,201 @@
 # CORD-19 Data Analysis - Part 2: Data Cleaning and Preparation
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
 import re
 
 print("=== CORD-19 Dataset Analysis ===")
 print("Part 2: Data Cleaning and Preparation\n")
 
-# Load the data (assuming Part 1 was run or data is already loaded)
+# The metadata file is streamed in chunks so memory stays bounded by the
+# chunk size rather than by the size of the whole CSV
+CHUNK_SIZE = 500_000
+# Only the columns that cleaning and the later parts use are parsed at all;
+# the remaining metadata columns are skipped by the CSV reader
+USE_COLUMNS = ['title', 'abstract', 'authors', 'journal', 'publish_time', 'source_x', 'source']
+# Low-cardinality text columns are read as categoricals, not Python strings;
+# free text is always read as str so every chunk has the same column types
+COLUMN_DTYPES = {
+    **{col: str for col in ['title', 'abstract', 'authors']},
+    **{col: 'category' for col in ['journal', 'source_x', 'source']},
+}
+CLEANED_PATH = 'data/metadata_cleaned.parquet'
+current_year = datetime.now().year
+
+def parquet_schema(chunk):
+    """Arrow schema for the cleaned file, fixed from the first chunk so every row group matches"""
+    schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+    fields = []
+    for field in schema:
+        dtype = chunk[field.name].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Each chunk has its own categories, so use one wide dictionary type
+            field = field.with_type(pa.dictionary(pa.int32(), pa.string()))
+        elif dtype == object:
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+def word_count(text):
+    """Whitespace-separated words in each string of a column with no missing values"""
+    # One C-level str.split per string, counted straight into an array: no
+    # regex per row and no intermediate copy of the text or list column
+    return np.fromiter((len(s.split()) for s in text.to_numpy()), dtype=np.int32, count=len(text))
+
+def clean(chunk):
+    """Clean one chunk of metadata and add the derived feature columns"""
+    # Remove rows where both title and abstract are missing (no useful content)
+    chunk = chunk.dropna(subset=['title', 'abstract'], how='all')
+
+    # Convert publish_time to datetime and extract the year. ISO8601 accepts
+    # both '2020' and '2020-03-15', so parsing does not depend on which
+    # format happens to come first in a chunk. assign returns a new frame, so
+    # the dropna result is never written to in place
+    if 'publish_time' in chunk.columns:
+        publish_time = pd.to_datetime(chunk['publish_time'], format='ISO8601', errors='coerce')
+        chunk = chunk.assign(publish_time=publish_time, publish_year=publish_time.dt.year)
+
+    # Remove obviously incorrect years (before 1900 or future years) before
+    # any text features are computed for rows that would be dropped. No
+    # missing years survive the filter, so the year fits a plain int16 and
+    # second resolution is plenty for publication dates
+    if 'publish_year' in chunk.columns:
+        chunk = chunk[
+            (chunk['publish_year'] >= 1900) &
+            (chunk['publish_year'] <= current_year)
+        ].astype({'publish_year': 'int16', 'publish_time': 'datetime64[s]'})
+
+    # Fill missing text and derive every feature column in one vectorized
+    # pass, so each text column is traversed once:
+    # - word counts are whitespace-separated words
+    # - author count is semicolons and commas plus one, at least 1 author
+    #   if the string exists
+    title = chunk['title'].fillna('Unknown Title')
+    abstract = chunk['abstract'].fillna('')
+    authors = chunk['authors'].fillna('')
+    abstract_word_count = word_count(abstract).astype('int32')
+    author_separators = authors.str.count(r'[;,]').to_numpy()
+    chunk = chunk.assign(
+        title=title,
+        abstract=abstract,
+        abstract_word_count=abstract_word_count,
+        title_word_count=word_count(title).astype('int16'),
+        has_abstract=abstract_word_count > 0,
+        author_count=np.where(authors.to_numpy() == '', 0, np.maximum(1, author_separators + 1)).astype('int16'),
+    )
+
+    return chunk
+
+# Running totals, so the summary never needs the whole dataset in memory
+total_rows = 0
+non_null = None
+rows_with_content = 0
+final_rows = 0
+abstract_words = 0
+title_words = 0
+papers_with_abstracts = 0
+authors_total = 0
+valid_dates = 0
+journal_info = 0
+min_year = np.nan
+max_year = np.nan
+sample = None
+
+print("=== Creating Cleaned Dataset ===")
 try:
-    df = pd.read_csv('data/metadata.csv')
-    print(f"✅ Data loaded: {df.shape[0]:,} rows, {df.shape[1]} columns")
-except:
+    reader = pd.read_csv('data/metadata.csv', chunksize=CHUNK_SIZE,
+                         usecols=lambda col: col in USE_COLUMNS, dtype=COLUMN_DTYPES)
+except FileNotFoundError:
     print("❌ Please ensure metadata.csv is available and Part 1 was completed")
     exit()
 
-# Step 1: Identify columns with many missing values
+writer = None
+with reader:
+    for i, chunk in enumerate(reader):
+        total_rows += len(chunk)
+        chunk_non_null = chunk.notna().sum()
+        non_null = chunk_non_null if non_null is None else non_null.add(chunk_non_null, fill_value=0)
+        rows_with_content += len(chunk) - (chunk['title'].isna() & chunk['abstract'].isna()).sum()
+
+        chunk = clean(chunk)
+
+        # Append the cleaned chunk to the Parquet file as a new row group
+        if writer is None:
+            schema = parquet_schema(chunk)
+            writer = pq.ParquetWriter(CLEANED_PATH, schema, compression='snappy')
+        writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+        final_rows += len(chunk)
+        abstract_words += chunk['abstract_word_count'].sum()
+        title_words += chunk['title_word_count'].sum()
+        papers_with_abstracts += chunk['has_abstract'].sum()
+        authors_total += chunk['author_count'].sum()
+        valid_dates += chunk['publish_time'].notna().sum()
+        journal_info += chunk['journal'].notna().sum()
+        if len(chunk) > 0:
+            min_year = np.fmin(min_year, chunk['publish_year'].min())
+            max_year = np.fmax(max_year, chunk['publish_year'].max())
+            if sample is None:
+                sample = chunk.head()
+
+        print(f"  Chunk {i + 1}: {len(chunk):,} rows cleaned")
+
+if writer is not None:
+    writer.close()
+
+print(f"✅ Data processed: {total_rows:,} rows")
+print(f"✅ Cleaned dataset saved as 'metadata_cleaned.parquet'")
+
+# Step 1: Identify columns with many missing values (among the columns
+# loaded above; Part 1 reports on every column)
 print("\n=== Missing Data Analysis ===")
 missing_threshold = 0.5  # 50% threshold
-missing_data = df.isnull().sum()
-missing_percent = (missing_data / len(df)) * 100
+missing_data = total_rows - non_null
+missing_percent = (missing_data / total_rows) * 100
 
 high_missing = missing_percent[missing_percent > missing_threshold * 100]
 print(f"Columns with more than {missing_threshold*100}% missing data:")
 for col, pct in high_missing.items():
     print(f"  {col}: {pct:.1f}% missing")
 
-# Step 2: Create a cleaned dataset
-print("\n=== Creating Cleaned Dataset ===")
+# Step 2: Rows removed during cleaning
+print("\n=== Cleaning Results ===")
+print(f"Removed {total_rows - rows_with_content:,} rows with no title or abstract")
+print(f"Final cleaned dataset: {final_rows:,} rows")
 
-# Start with a copy of the original data
-df_clean = df.copy()
-
-# Remove rows where both title and abstract are missing (no useful content)
-initial_rows = len(df_clean)
-df_clean = df_clean.dropna(subset=['title', 'abstract'], how='all')
-rows_after_cleanup = len(df_clean)
-print(f"Removed {initial_rows - rows_after_cleanup:,} rows with no title or abstract")
-
-# Fill missing titles with "Unknown Title"
-df_clean['title'] = df_clean['title'].fillna('Unknown Title')
-
-# Fill missing abstracts with empty string for processing
-df_clean['abstract'] = df_clean['abstract'].fillna('')
-
-print(f"Final cleaned dataset: {len(df_clean):,} rows")
-
-# Step 3: Handle date columns
+# Step 3: Dates
 print("\n=== Processing Dates ===")
-if 'publish_time' in df_clean.columns:
-    # Convert publish_time to datetime
-    try:
-        df_clean['publish_time'] = pd.to_datetime(df_clean['publish_time'], errors='coerce')
-        
-        # Extract year from publication date
-        df_clean['publish_year'] = df_clean['publish_time'].dt.year
-        
-        # Remove obviously incorrect years (before 1900 or future years)
-        current_year = datetime.now().year
-        df_clean = df_clean[
-            (df_clean['publish_year'] >= 1900) & 
-            (df_clean['publish_year'] <= current_year)
-        ]
-        
-        valid_dates = df_clean['publish_time'].notna().sum()
-        print(f"✅ Processed dates successfully")
-        print(f"Papers with valid publication dates: {valid_dates:,}")
-        print(f"Date range: {df_clean['publish_year'].min():.0f} - {df_clean['publish_year'].max():.0f}")
-        
-    except Exception as e:
-        print(f"❌ Error processing dates: {e}")
-
-# Step 4: Create new useful columns
-print("\n=== Creating New Features ===")
-
-# Abstract word count
-df_clean['abstract_word_count'] = df_clean['abstract'].apply(
-    lambda x: len(str(x).split()) if pd.notna(x) else 0
-)
-
-# Title word count
-df_clean['title_word_count'] = df_clean['title'].apply(
-    lambda x: len(str(x).split()) if pd.notna(x) else 0
-)
-
-# Has abstract flag
-df_clean['has_abstract'] = df_clean['abstract_word_count'] > 0
-
-# Simple author count (counting semicolons and commas as separators)
-def count_authors(author_string):
-    if pd.isna(author_string) or author_string == '':
-        return 0
-    # Count both semicolons and commas as author separators
-    separators = author_string.count(';') + author_string.count(',')
-    return max(1, separators + 1)  # At least 1 author if string exists
-
-df_clean['author_count'] = df_clean['authors'].apply(count_authors)
+print(f"Papers with valid publication dates: {valid_dates:,}")
+print(f"Date range: {min_year:.0f} - {max_year:.0f}")
 
+# Step 4: New useful columns
+print("\n=== Creating New Features ===")
 print("New columns created:")
-print(f"  - abstract_word_count: avg {df_clean['abstract_word_count'].mean():.1f} words")
-print(f"  - title_word_count: avg {df_clean['title_word_count'].mean():.1f} words") 
-print(f"  - has_abstract: {df_clean['has_abstract'].sum():,} papers have abstracts")
-print(f"  - author_count: avg {df_clean['author_count'].mean():.1f} authors per paper")
+print(f"  - abstract_word_count: avg {abstract_words / final_rows:.1f} words")
+print(f"  - title_word_count: avg {title_words / final_rows:.1f} words")
+print(f"  - has_abstract: {papers_with_abstracts:,} papers have abstracts")
+print(f"  - author_count: avg {authors_total / final_rows:.1f} authors per paper")
 
 # Step 5: Summary of cleaned data
 print("\n=== Cleaned Dataset Summary ===")
-print(f"Final dataset dimensions: {df_clean.shape}")
-print(f"Papers with titles: {df_clean['title'].notna().sum():,}")
-print(f"Papers with abstracts: {(df_clean['abstract_word_count'] > 0).sum():,}")
-print(f"Papers with valid dates: {df_clean['publish_time'].notna().sum():,}")
-print(f"Papers with journal info: {df_clean['journal'].notna().sum():,}")
-
-# Save cleaned dataset
-try:
-    df_clean.to_csv('data/metadata_cleaned.csv', index=False)
-    print(f"✅ Cleaned dataset saved as 'metadata_cleaned.csv'")
-except Exception as e:
-    print(f"⚠️  Could not save cleaned dataset: {e}")
+print(f"Final dataset dimensions: ({final_rows}, {len(sample.columns) if sample is not None else 0})")
+print(f"Papers with titles: {final_rows:,}")
+print(f"Papers with abstracts: {papers_with_abstracts:,}")
+print(f"Papers with valid dates: {valid_dates:,}")
+print(f"Papers with journal info: {journal_info:,}")
 
 # Quick preview of the cleaned data
 print("\n=== Sample of Cleaned Data ===")
-sample_cols = ['title', 'abstract_word_count', 'title_word_count', 'publish_year', 'author_count']
-available_cols = [col for col in sample_cols if col in df_clean.columns]
-print(df_clean[available_cols].head())
+if sample is not None:
+    sample_cols = ['title', 'abstract_word_count', 'title_word_count', 'publish_year', 'author_count']
+    available_cols = [col for col in sample_cols if col in sample.columns]
+    print(sample[available_cols])
 
 print("\n" + "="*50)
 print("Part 2 Complete! ✅")
 print("Next: Run Part 3 for Data Analysis and Visualization")
 
 # Make cleaned data available for next parts
-print(f"\nCleaned dataset ready with {len(df_clean):,} papers")
\ No newline at end of file
+print(f"\nCleaned dataset ready with {final_rows:,} papers")
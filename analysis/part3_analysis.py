@@ -1,228 +1,350 @@
 # CORD-19 Data Analysis - Part 3: Data Analysis and Visualization
+import os
+import io
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter
-import re
-from wordcloud import WordCloud
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.dataset as pads
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
 import warnings
 warnings.filterwarnings('ignore')
 
-print("=== CORD-19 Dataset Analysis ===")
-print("Part 3: Data Analysis and Visualization\n")
+# Arrow-backed string columns instead of Python objects, with empty fields
+# read as missing and the low-cardinality columns dictionary-encoded into
+# categoricals
+arrow_types = {pa.string(): pd.StringDtype('pyarrow')}.get
+convert_options = pv.ConvertOptions(
+    strings_can_be_null=True,
+    column_types={col: pa.dictionary(pa.int32(), pa.string())
+                  for col in ['journal', 'source_x', 'source', 'license']}
+)
+
+CLEANED_PATH = 'data/metadata_cleaned.parquet'
+# Part 3's own on-the-fly cleaning is cached separately: it lacks Part 2's
+# feature columns, so it must never stand in for Part 2's file elsewhere
+FALLBACK_PATH = 'data/metadata_part3_fallback.parquet'
+
+def data_path():
+    """Part 2's cleaned file if it exists, otherwise Part 3's on-the-fly cache"""
+    return CLEANED_PATH if os.path.exists(CLEANED_PATH) else FALLBACK_PATH
+
+# Title tokenizer settings, built once: characters that are neither
+# lowercase letters nor whitespace are deleted (so 'sars-cov' is one word,
+# 'sarscov'), and common stop words are left out of the counts
+NON_LETTERS = pc.ReplaceSubstringOptions(pattern=r'[^a-z\s]', replacement='')
+STOP_WORD_LOOKUP = pc.SetLookupOptions(value_set=pa.array(sorted({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'cannot'})))
+
+@lru_cache(maxsize=None)
+def cleaned_dataset():
+    """The cleaned Parquet file as a memory-mapped Arrow dataset, opened once per process"""
+    return pads.dataset(data_path(), format='parquet', filesystem=pafs.LocalFileSystem(use_mmap=True))
+
+def column(name, flt=None):
+    """Read one column of the cleaned dataset, pushing an optional row filter into the scan"""
+    return cleaned_dataset().to_table(columns=[name], filter=flt).column(0)
+
+@lru_cache(maxsize=None)
+def plotting():
+    """pyplot with the plotting style set up, imported the first time a process draws"""
+    # Figures are only saved to plots/, so no GUI backend is needed
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Set up plotting style
+    plt.style.use('default')
+    sns.set_palette("husl")
+    plt.rcParams['figure.figsize'] = (12, 8)
+    return plt
 
-# Set up plotting style
-plt.style.use('default')
-sns.set_palette("husl")
-plt.rcParams['figure.figsize'] = (12, 8)
+def available_columns():
+    """Column names in the cleaned dataset, without reading any data"""
+    return cleaned_dataset().schema.names
 
-# Load cleaned data
-try:
-    df_clean = pd.read_csv('data/metadata_cleaned.csv')
-    print(f"✅ Loaded cleaned data: {df_clean.shape[0]:,} papers")
-except:
-    # If cleaned file doesn't exist, load and clean the original
+def prepare_cleaned_data():
+    """Make sure cleaned Parquet data exists, cleaning on the fly if needed"""
+    if os.path.exists(CLEANED_PATH):
+        print(f"✅ Found cleaned data: {pq.read_metadata(CLEANED_PATH).num_rows:,} papers")
+        return
+    if os.path.exists(FALLBACK_PATH):
+        print(f"✅ Found data cleaned on-the-fly: {pq.read_metadata(FALLBACK_PATH).num_rows:,} papers")
+        return
+
+    # If cleaned file doesn't exist, load and clean the original, then cache
+    # it under Part 3's own path so each analysis can read just its own columns
     print("Loading and cleaning original data...")
-    df = pd.read_csv('data/metadata.csv')
-    df_clean = df.copy()
+    df = pv.read_csv('data/metadata.csv', convert_options=convert_options).to_pandas(types_mapper=arrow_types)
+    # Keep only the columns the analyses use rather than deep-copying the
+    # whole frame, and release the rest straight away
+    df_clean = df[[col for col in ['title', 'abstract', 'journal', 'publish_time', 'source_x', 'source'] if col in df.columns]]
+    del df
     df_clean = df_clean.dropna(subset=['title', 'abstract'], how='all')
     df_clean['title'] = df_clean['title'].fillna('Unknown Title')
     df_clean['abstract'] = df_clean['abstract'].fillna('')
     df_clean['publish_time'] = pd.to_datetime(df_clean['publish_time'], errors='coerce')
     df_clean['publish_year'] = df_clean['publish_time'].dt.year
     df_clean = df_clean[(df_clean['publish_year'] >= 1900) & (df_clean['publish_year'] <= 2024)]
+    df_clean.to_parquet(FALLBACK_PATH, index=False)
     print(f"✅ Cleaned data on-the-fly: {df_clean.shape[0]:,} papers")
 
-# Create output directory for plots
-import os
-os.makedirs('plots', exist_ok=True)
-
-print("\n=== Analysis 1: Publications Over Time ===")
-
-# Filter for reasonable years and COVID-era focus
-covid_years = df_clean[df_clean['publish_year'] >= 2015].copy()
-year_counts = covid_years['publish_year'].value_counts().sort_index()
-
-plt.figure(figsize=(12, 6))
-bars = plt.bar(year_counts.index, year_counts.values, color='steelblue', alpha=0.7)
-plt.title('COVID-19 Research Papers by Publication Year', fontsize=16, fontweight='bold')
-plt.xlabel('Year', fontsize=12)
-plt.ylabel('Number of Papers', fontsize=12)
-plt.grid(axis='y', alpha=0.3)
-
-# Add value labels on bars
-for bar in bars:
-    height = bar.get_height()
-    plt.text(bar.get_x() + bar.get_width()/2., height + 50,
-             f'{int(height):,}', ha='center', va='bottom')
-
-plt.tight_layout()
-plt.savefig('plots/publications_by_year.png', dpi=300, bbox_inches='tight')
-plt.show()
-
-print(f"Peak year: {year_counts.idxmax()} with {year_counts.max():,} papers")
-
-print("\n=== Analysis 2: Top Publishing Journals ===")
-
-# Analyze top journals
-journal_counts = df_clean['journal'].value_counts().head(15)
-print("Top 15 journals publishing COVID-19 research:")
-for i, (journal, count) in enumerate(journal_counts.items(), 1):
-    print(f"{i:2d}. {journal}: {count:,} papers")
-
-# Plot top journals
-plt.figure(figsize=(14, 8))
-bars = plt.barh(range(len(journal_counts)), journal_counts.values, color='coral', alpha=0.7)
-plt.yticks(range(len(journal_counts)), [j[:50] + '...' if len(j) > 50 else j for j in journal_counts.index])
-plt.xlabel('Number of Papers', fontsize=12)
-plt.title('Top 15 Journals Publishing COVID-19 Research', fontsize=16, fontweight='bold')
-plt.grid(axis='x', alpha=0.3)
-
-# Add value labels
-for i, bar in enumerate(bars):
-    width = bar.get_width()
-    plt.text(width + 10, bar.get_y() + bar.get_height()/2,
-             f'{int(width):,}', ha='left', va='center')
-
-plt.tight_layout()
-plt.savefig('plots/top_journals.png', dpi=300, bbox_inches='tight')
-plt.show()
-
-print("\n=== Analysis 3: Word Frequency in Titles ===")
-
-# Extract and analyze title words
-def clean_title_text(text):
-    """Clean and prepare text for word frequency analysis"""
-    if pd.isna(text):
-        return ""
-    # Convert to lowercase and remove special characters
-    text = re.sub(r'[^a-zA-Z\s]', '', str(text).lower())
-    # Remove common stop words
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'cannot'}
-    words = [word for word in text.split() if len(word) > 2 and word not in stop_words]
-    return ' '.join(words)
-
-# Get all title words
-all_titles = ' '.join(df_clean['title'].apply(clean_title_text))
-word_freq = Counter(all_titles.split())
-
-# Get top words
-top_words = dict(word_freq.most_common(20))
-print("Top 20 words in paper titles:")
-for i, (word, count) in enumerate(top_words.items(), 1):
-    print(f"{i:2d}. '{word}': {count:,} times")
-
-# Plot word frequency
-plt.figure(figsize=(14, 8))
-words, counts = zip(*list(top_words.items()))
-bars = plt.bar(words, counts, color='lightgreen', alpha=0.7)
-plt.title('Most Frequent Words in Paper Titles (Top 20)', fontsize=16, fontweight='bold')
-plt.xlabel('Words', fontsize=12)
-plt.ylabel('Frequency', fontsize=12)
-plt.xticks(rotation=45, ha='right')
-plt.grid(axis='y', alpha=0.3)
-
-# Add value labels
-for bar in bars:
-    height = bar.get_height()
-    plt.text(bar.get_x() + bar.get_width()/2., height + 20,
-             f'{int(height):,}', ha='center', va='bottom', rotation=90)
-
-plt.tight_layout()
-plt.savefig('plots/word_frequency.png', dpi=300, bbox_inches='tight')
-plt.show()
-
-print("\n=== Analysis 4: Word Cloud of Titles ===")
-
-# Create word cloud
-try:
-    wordcloud = WordCloud(width=800, height=400, 
-                         background_color='white',
-                         max_words=100,
-                         colormap='viridis').generate(all_titles)
-    
-    plt.figure(figsize=(15, 8))
-    plt.imshow(wordcloud, interpolation='bilinear')
-    plt.axis('off')
-    plt.title('Word Cloud of Paper Titles', fontsize=20, fontweight='bold', pad=20)
+def publications_over_time():
+    """Analysis 1: papers per publication year, from 2015 on"""
+    print("\n=== Analysis 1: Publications Over Time ===")
+    # Filter for reasonable years and COVID-era focus while scanning
+    covid_years = column('publish_year', pc.field('publish_year') >= 2015).to_numpy().astype(np.int64)
+
+    # Years are small integers, so count them into a dense array in one
+    # linear pass instead of hashing every row; drop years with no papers
+    year_counts = pd.Series(np.bincount(covid_years - 2015))
+    year_counts.index += 2015
+    year_counts = year_counts[year_counts > 0]
+
+    plt = plotting()
+    plt.figure(figsize=(12, 6))
+    bars = plt.bar(year_counts.index, year_counts.values, color='steelblue', alpha=0.7)
+    plt.title('COVID-19 Research Papers by Publication Year', fontsize=16, fontweight='bold')
+    plt.xlabel('Year', fontsize=12)
+    plt.ylabel('Number of Papers', fontsize=12)
+    plt.grid(axis='y', alpha=0.3)
+
+    # Add value labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height + 50,
+                 f'{int(height):,}', ha='center', va='bottom')
+
+    plt.tight_layout()
+    plt.savefig('plots/publications_by_year.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    print(f"Peak year: {year_counts.idxmax()} with {year_counts.max():,} papers")
+    return year_counts
+
+def top_journals():
+    """Analysis 2: the 15 journals with the most papers"""
+    print("\n=== Analysis 2: Top Publishing Journals ===")
+
+    # Analyze top journals
+    journal_counts = column('journal').to_pandas().value_counts().head(15)
+    print("Top 15 journals publishing COVID-19 research:")
+    for i, (journal, count) in enumerate(journal_counts.items(), 1):
+        print(f"{i:2d}. {journal}: {count:,} papers")
+
+    plt = plotting()
+    # Plot top journals
+    plt.figure(figsize=(14, 8))
+    bars = plt.barh(range(len(journal_counts)), journal_counts.values, color='coral', alpha=0.7)
+    plt.yticks(range(len(journal_counts)), [j[:50] + '...' if len(j) > 50 else j for j in journal_counts.index])
+    plt.xlabel('Number of Papers', fontsize=12)
+    plt.title('Top 15 Journals Publishing COVID-19 Research', fontsize=16, fontweight='bold')
+    plt.grid(axis='x', alpha=0.3)
+
+    # Add value labels
+    for i, bar in enumerate(bars):
+        width = bar.get_width()
+        plt.text(width + 10, bar.get_y() + bar.get_height()/2,
+                 f'{int(width):,}', ha='left', va='center')
+
     plt.tight_layout()
-    plt.savefig('plots/title_wordcloud.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    print("✅ Word cloud created successfully!")
-    
-except ImportError:
-    print("⚠️  WordCloud not installed. Run: pip install wordcloud")
-except Exception as e:
-    print(f"⚠️  Could not create word cloud: {e}")
-
-print("\n=== Analysis 5: Paper Characteristics ===")
-
-# Abstract length analysis
-if 'abstract_word_count' in df_clean.columns:
-    abstract_stats = df_clean['abstract_word_count'].describe()
+    plt.savefig('plots/top_journals.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    return journal_counts
+
+def word_frequency():
+    """Analyses 3 and 4: the 20 most frequent title words, plus their word cloud"""
+    print("\n=== Analysis 3: Word Frequency in Titles ===")
+
+    # Tokenize every title with Arrow compute kernels: lowercase, delete
+    # anything that is not a letter or whitespace, split on whitespace, flatten
+    # to one word per row and keep words of 3+ letters that are not stop words
+    titles = pc.replace_substring_regex(pc.utf8_lower(column('title')), options=NON_LETTERS)
+    tokens = pc.list_flatten(pc.utf8_split_whitespace(titles))
+    keep = pc.and_(
+        pc.greater_equal(pc.utf8_length(tokens), 3),
+        pc.invert(pc.is_in(tokens, options=STOP_WORD_LOOKUP))
+    )
+    title_words = pc.filter(tokens, keep)
+
+    # Count words on integer dictionary codes instead of hashing strings into
+    # a Python dict, then pick the top 200 with a partial sort; the word cloud
+    # draws from all of them and the chart from the first 20
+    encoded = pc.dictionary_encode(title_words.combine_chunks())
+    word_counts = np.bincount(encoded.indices.to_numpy(), minlength=len(encoded.dictionary))
+    n_top = min(200, len(word_counts))
+    top_idx = np.argpartition(word_counts, -n_top)[-n_top:]
+    # Order by count, breaking ties by first appearance as Counter.most_common did
+    top_idx = top_idx[np.lexsort((top_idx, -word_counts[top_idx]))]
+    word_freq = dict(zip(encoded.dictionary.take(pa.array(top_idx)).to_pylist(), word_counts[top_idx].tolist()))
+
+    # Get top words
+    top_words = dict(list(word_freq.items())[:20])
+    print("Top 20 words in paper titles:")
+    for i, (word, count) in enumerate(top_words.items(), 1):
+        print(f"{i:2d}. '{word}': {count:,} times")
+
+    plt = plotting()
+    # Plot word frequency
+    plt.figure(figsize=(14, 8))
+    words, counts = zip(*list(top_words.items()))
+    bars = plt.bar(words, counts, color='lightgreen', alpha=0.7)
+    plt.title('Most Frequent Words in Paper Titles (Top 20)', fontsize=16, fontweight='bold')
+    plt.xlabel('Words', fontsize=12)
+    plt.ylabel('Frequency', fontsize=12)
+    plt.xticks(rotation=45, ha='right')
+    plt.grid(axis='y', alpha=0.3)
+
+    # Add value labels
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height + 20,
+                 f'{int(height):,}', ha='center', va='bottom', rotation=90)
+
+    plt.tight_layout()
+    plt.savefig('plots/word_frequency.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    word_cloud(word_freq)
+    return top_words
+
+def word_cloud(word_freq):
+    """Analysis 4: word cloud of the most frequent title words"""
+    print("\n=== Analysis 4: Word Cloud of Titles ===")
+
+    # Create word cloud from the counts already computed, rather than joining
+    # every title word into one string for wordcloud to tokenize again
+    try:
+        from wordcloud import WordCloud
+        plt = plotting()
+        wordcloud = WordCloud(width=800, height=400,
+                             background_color='white',
+                             max_words=100,
+                             colormap='viridis').generate_from_frequencies(word_freq)
+
+        plt.figure(figsize=(15, 8))
+        plt.imshow(wordcloud, interpolation='bilinear')
+        plt.axis('off')
+        plt.title('Word Cloud of Paper Titles', fontsize=20, fontweight='bold', pad=20)
+        plt.tight_layout()
+        plt.savefig('plots/title_wordcloud.png', dpi=300, bbox_inches='tight')
+        plt.close()
+        print("✅ Word cloud created successfully!")
+
+    except ImportError:
+        print("⚠️  WordCloud not installed. Run: pip install wordcloud")
+    except Exception as e:
+        print(f"⚠️  Could not create word cloud: {e}")
+
+def paper_characteristics():
+    """Analysis 5: distribution of abstract lengths"""
+    print("\n=== Analysis 5: Paper Characteristics ===")
+
+    # Abstract length analysis
+    if 'abstract_word_count' not in available_columns():
+        return
+    abstract_word_count = column('abstract_word_count').to_numpy()
+    median, q99 = np.quantile(abstract_word_count, [0.5, 0.99])
     print("Abstract length statistics:")
-    print(f"  Average: {abstract_stats['mean']:.1f} words")
-    print(f"  Median: {abstract_stats['50%']:.1f} words")
-    print(f"  Max: {abstract_stats['max']:.0f} words")
-    
+    print(f"  Average: {abstract_word_count.mean():.1f} words")
+    print(f"  Median: {median:.1f} words")
+    print(f"  Max: {abstract_word_count.max():.0f} words")
+
+    # Remove outliers for better visualization, and bin once with NumPy so
+    # matplotlib only draws the 50 precomputed bars
+    counts, edges = np.histogram(abstract_word_count[abstract_word_count <= q99], bins=50)
+
+    plt = plotting()
     plt.figure(figsize=(12, 6))
-    # Remove outliers for better visualization
-    q99 = df_clean['abstract_word_count'].quantile(0.99)
-    filtered_abstracts = df_clean[df_clean['abstract_word_count'] <= q99]['abstract_word_count']
-    
-    plt.hist(filtered_abstracts, bins=50, color='skyblue', alpha=0.7, edgecolor='black')
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='skyblue', alpha=0.7, edgecolor='black')
     plt.title('Distribution of Abstract Lengths (99th percentile)', fontsize=16, fontweight='bold')
     plt.xlabel('Abstract Word Count', fontsize=12)
     plt.ylabel('Number of Papers', fontsize=12)
     plt.grid(axis='y', alpha=0.3)
     plt.tight_layout()
     plt.savefig('plots/abstract_length_distribution.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    plt.close()
 
-print("\n=== Analysis 6: Source Distribution ===")
+def source_distribution():
+    """Analysis 6: the 10 source databases with the most papers"""
+    print("\n=== Analysis 6: Source Distribution ===")
 
-# Analyze paper sources
-if 'source_x' in df_clean.columns:
-    source_col = 'source_x'
-elif 'source' in df_clean.columns:
-    source_col = 'source'
-else:
-    source_col = None
+    # Analyze paper sources
+    columns = available_columns()
+    if 'source_x' in columns:
+        source_col = 'source_x'
+    elif 'source' in columns:
+        source_col = 'source'
+    else:
+        print("No source column found in the dataset")
+        return
 
-if source_col:
-    source_counts = df_clean[source_col].value_counts().head(10)
+    source_counts = column(source_col).to_pandas().value_counts().head(10)
     print(f"Top 10 sources:")
     for i, (source, count) in enumerate(source_counts.items(), 1):
         print(f"{i:2d}. {source}: {count:,} papers")
-    
+
+    plt = plotting()
     plt.figure(figsize=(12, 6))
     bars = plt.bar(range(len(source_counts)), source_counts.values, color='orange', alpha=0.7)
     plt.xticks(range(len(source_counts)), source_counts.index, rotation=45, ha='right')
     plt.title('Papers by Source Database', fontsize=16, fontweight='bold')
     plt.ylabel('Number of Papers', fontsize=12)
     plt.grid(axis='y', alpha=0.3)
-    
+
     for bar in bars:
         height = bar.get_height()
         plt.text(bar.get_x() + bar.get_width()/2., height + 100,
                  f'{int(height):,}', ha='center', va='bottom')
-    
+
     plt.tight_layout()
     plt.savefig('plots/source_distribution.png', dpi=300, bbox_inches='tight')
-    plt.show()
-else:
-    print("No source column found in the dataset")
-
-print("\n=== Summary of Key Findings ===")
-print(f"📊 Total papers analyzed: {len(df_clean):,}")
-print(f"📅 Publication years: {df_clean['publish_year'].min():.0f} - {df_clean['publish_year'].max():.0f}")
-print(f"📰 Top journal: {journal_counts.index[0]} ({journal_counts.iloc[0]:,} papers)")
-print(f"📈 Peak publication year: {year_counts.idxmax()} ({year_counts.max():,} papers)")
-print(f"🔤 Most common title word: '{list(top_words.keys())[0]}' ({list(top_words.values())[0]:,} times)")
-
-print("\n" + "="*60)
-print("Part 3 Complete! ✅")
-print("All visualizations saved in 'plots/' directory")
-print("Next: Create the Streamlit application (Part 4)")
-print("="*60)
\ No newline at end of file
+    plt.close()
+
+def run_analysis(analysis):
+    """Run one analysis in a worker process and return its printed report with its result"""
+    with contextlib.redirect_stdout(io.StringIO()) as report:
+        result = analysis()
+    return report.getvalue(), result
+
+if __name__ == "__main__":
+    print("=== CORD-19 Dataset Analysis ===")
+    print("Part 3: Data Analysis and Visualization\n")
+
+    prepare_cleaned_data()
+
+    # Create output directory for plots
+    os.makedirs('plots', exist_ok=True)
+
+    # The analyses are independent and each reads only its own columns, so
+    # they run side by side in worker processes; reports are printed in order
+    analyses = [publications_over_time, top_journals, word_frequency, paper_characteristics, source_distribution]
+    # One worker per analysis; the default of one per CPU would start
+    # processes that never get a task
+    with ProcessPoolExecutor(max_workers=len(analyses)) as executor:
+        futures = [executor.submit(run_analysis, analysis) for analysis in analyses]
+        results = []
+        for future in futures:
+            report, result = future.result()
+            print(report, end='')
+            results.append(result)
+    year_counts, journal_counts, top_words = results[:3]
+    year_range = pc.min_max(column('publish_year'))
+
+    print("\n=== Summary of Key Findings ===")
+    print(f"📊 Total papers analyzed: {pq.read_metadata(data_path()).num_rows:,}")
+    print(f"📅 Publication years: {year_range['min'].as_py():.0f} - {year_range['max'].as_py():.0f}")
+    print(f"📰 Top journal: {journal_counts.index[0]} ({journal_counts.iloc[0]:,} papers)")
+    print(f"📈 Peak publication year: {year_counts.idxmax()} ({year_counts.max():,} papers)")
+    print(f"🔤 Most common title word: '{list(top_words.keys())[0]}' ({list(top_words.values())[0]:,} times)")
+
+    print("\n" + "="*60)
+    print("Part 3 Complete! ✅")
+    print("All visualizations saved in 'plots/' directory")
+    print("Next: Create the Streamlit application (Part 4)")
+    print("="*60)
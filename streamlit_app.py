@@ -1,12 +1,15 @@
+import io
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+from matplotlib.figure import Figure
 import plotly.express as px
-import plotly.graph_objects as go
-from collections import Counter
-import re
+import altair as alt
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
@@ -42,17 +45,33 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Columns the dashboard reads or offers for download
+APP_COLUMNS = ['title', 'abstract', 'journal', 'authors', 'publish_year',
+               'abstract_word_count', 'title_word_count', 'has_abstract']
+CLEANED_PATH = 'data/metadata_cleaned.parquet'
+# The dashboard's own cleaning of the raw CSV is cached separately: it only
+# holds the dashboard's columns, so it must never replace Part 2's file
+DASHBOARD_CACHE_PATH = 'data/metadata_dashboard.parquet'
+
+def word_count(text):
+    """Whitespace-separated words in each string of a column with no missing values"""
+    # One C-level str.split per string, counted straight into an array: no
+    # regex per row and no intermediate copy of the text or list column
+    return np.fromiter((len(s.split()) for s in text.to_numpy()), dtype=np.int32, count=len(text))
+
 @st.cache_data
 def load_data():
     """Load and cache the dataset"""
     try:
-        # Try to load cleaned data first
-        df = pd.read_csv('data/metadata_cleaned.csv')
+        # Try to load cleaned data first, from Part 2 or the dashboard's cache
+        # and read only the columns the dashboard uses
+        path = CLEANED_PATH if os.path.exists(CLEANED_PATH) else DASHBOARD_CACHE_PATH
+        df = pd.read_parquet(path, columns=[c for c in APP_COLUMNS if c in pq.read_schema(path).names])
         st.success("✅ Loaded cleaned dataset")
     except:
         try:
             # Load original data and clean it
-            df = pd.read_csv('metadata.csv')
+            df = pd.read_csv('metadata.csv', usecols=lambda col: col in APP_COLUMNS + ['publish_time'])
             df = df.dropna(subset=['title', 'abstract'], how='all')
             df['title'] = df['title'].fillna('Unknown Title')
             df['abstract'] = df['abstract'].fillna('')
@@ -61,25 +80,230 @@ def load_data():
             df = df[(df['publish_year'] >= 1900) & (df['publish_year'] <= datetime.now().year)]
             
             # Create additional features
-            df['abstract_word_count'] = df['abstract'].apply(lambda x: len(str(x).split()) if pd.notna(x) else 0)
-            df['title_word_count'] = df['title'].apply(lambda x: len(str(x).split()) if pd.notna(x) else 0)
+            df['abstract_word_count'] = word_count(df['abstract']).astype('int32')
+            df['title_word_count'] = word_count(df['title']).astype('int32')
             df['has_abstract'] = df['abstract_word_count'] > 0
             
+            # Save the cleaned data as Parquet so later starts load it
+            # directly, with journals as categories and years as int16
+            df = df.astype({'journal': 'category', 'publish_year': 'int16'})
+            try:
+                df.to_parquet(DASHBOARD_CACHE_PATH, compression='zstd', index=False)
+            except OSError as e:
+                st.warning(f"⚠️ Could not save cleaned dataset: {e}")
+            
             st.success("✅ Loaded and cleaned original dataset")
         except Exception as e:
             st.error(f"❌ Error loading data: {e}")
             st.stop()
     
+    # Journals repeat heavily, so keep them as a categorical: value_counts,
+    # nunique and isin then work on integer codes instead of strings
+    if 'journal' in df.columns and not isinstance(df['journal'].dtype, pd.CategoricalDtype):
+        df['journal'] = df['journal'].astype('category')
+    
+    # Keep only the columns the dashboard uses, with the narrowest integer
+    # types that hold them, so every filter and count scans less memory
+    df = df[[col for col in APP_COLUMNS if col in df.columns]]
+    for col in ['publish_year', 'abstract_word_count', 'title_word_count']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    
     return df
 
-def clean_text_for_wordfreq(text):
-    """Clean text for word frequency analysis"""
-    if pd.isna(text):
-        return ""
-    text = re.sub(r'[^a-zA-Z\s]', '', str(text).lower())
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-    words = [word for word in text.split() if len(word) > 2 and word not in stop_words]
-    return ' '.join(words)
+# Word frequency settings, built once rather than on every rerun:
+# characters that are not letters or whitespace, and common stop words
+# as Arrow kernel options, the same way Part 3 tokenizes titles
+_NON_LETTERS = pc.ReplaceSubstringOptions(pattern=r'[^a-z\s]', replacement='')
+_STOP = pc.SetLookupOptions(value_set=pa.array(sorted({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})))
+
+@st.cache_data
+def top_journal_names(_df, n=20):
+    """Names of the n journals with the most papers in the whole dataset"""
+    # The dataset comes from the cached load_data, so it never changes and
+    # the list is computed once rather than on every rerun
+    return _df['journal'].value_counts().head(n).index.tolist()
+
+def filtered_column(df, idx, col):
+    """One column of the filtered papers, given the row positions the filters keep"""
+    # Only the requested column is gathered, never the whole filtered frame
+    return df[col].iloc[idx]
+
+@st.cache_data
+def title_word_counts(_df, _idx, filter_key):
+    """Cleaned title word counts, most frequent first, cached per filter selection"""
+    # Streamlit skips hashing the leading-underscore data arguments; the
+    # filter selections identify the subset, so other widgets reuse the counts
+    # Clean and split every title with Arrow kernels: lowercase, delete
+    # anything that is not a letter or whitespace, split on whitespace and
+    # flatten to one word per row
+    titles = pa.array(filtered_column(_df, _idx, 'title').fillna(''), type=pa.string())
+    words = pc.list_flatten(pc.utf8_split_whitespace(pc.replace_substring_regex(pc.utf8_lower(titles), options=_NON_LETTERS)))
+
+    # Count integer dictionary codes in one pass, then drop short words and
+    # stop words from the vocabulary rather than testing every occurrence
+    encoded = pc.dictionary_encode(words)
+    vocab = encoded.dictionary
+    counts = np.bincount(encoded.indices.to_numpy(zero_copy_only=False), minlength=len(vocab))
+    keep = pc.and_(pc.greater(pc.utf8_length(vocab), 2), pc.invert(pc.is_in(vocab, options=_STOP)))
+    keep = keep.to_numpy(zero_copy_only=False)
+    counts, vocab = counts[keep], vocab.filter(pa.array(keep))
+    # Codes follow first appearance, so a stable sort keeps ties in
+    # first-seen order, as Counter.most_common did
+    order = np.argsort(-counts, kind='stable')
+    return pd.Series(counts[order], index=vocab.take(pa.array(order)).to_pylist())
+
+@st.cache_data
+def year_histogram(_df):
+    """Papers per publication year, sidebar journal and abstract flag, computed once"""
+    # The sidebar only offers the top journals, so every other journal shares
+    # code -1 and the histogram has at most years x (journals + 1) x 2 cells.
+    # The three keys are packed into one integer and counted with a
+    # sort-based unique count instead of hashing every row
+    journals = top_journal_names(_df) if 'journal' in _df.columns else []
+    years = _df['publish_year'].to_numpy()
+    valid = ~pd.isna(years)
+    years = years[valid].astype(np.int64)
+    journal_codes = (pd.Categorical(_df['journal'], categories=journals).codes[valid].astype(np.int64)
+                     if 'journal' in _df.columns else np.full(len(years), -1))
+    has_abstract = (_df['has_abstract'].to_numpy(dtype=bool)[valid]
+                    if 'has_abstract' in _df.columns else np.ones(len(years), dtype=bool))
+
+    n_journals = len(journals) + 1
+    first_year = years.min() if len(years) else 0
+    keys, counts = np.unique(((years - first_year) * n_journals + journal_codes + 1) * 2 + has_abstract,
+                             return_counts=True)
+    return pd.DataFrame({
+        'publish_year': keys // 2 // n_journals + first_year,
+        'journal': keys // 2 % n_journals - 1,
+        'has_abstract': (keys % 2).astype(bool),
+        'papers': counts,
+    })
+
+@st.cache_data
+def count_years(_df, _idx, filter_key):
+    """Papers per publication year, in year order, cached per filter selection"""
+    # Summed from the year histogram's cells, without reading the papers
+    year_range, selected_journals, include_no_abstract = filter_key
+    hist = year_histogram(_df)
+    keep = np.ones(len(hist), dtype=bool)
+    if year_range is not None:
+        keep &= hist['publish_year'].between(year_range[0], year_range[1]).to_numpy()
+    if selected_journals:
+        journals = top_journal_names(_df)
+        keep &= hist['journal'].isin([journals.index(j) for j in selected_journals]).to_numpy()
+    if not include_no_abstract:
+        keep &= hist['has_abstract'].to_numpy()
+    return hist[keep].groupby('publish_year')['papers'].sum()
+
+@st.cache_data
+def count_journals(_df, _idx, filter_key):
+    """Papers per journal, most frequent first, cached per filter selection"""
+    # A categorical column also counts journals with no papers left; drop them
+    journal_counts = filtered_column(_df, _idx, 'journal').value_counts()
+    return journal_counts[journal_counts > 0]
+
+@st.cache_data
+def word_count_stats(_df, _idx, filter_key, col):
+    """Mean, median and 99th percentile of a word-count column, cached per filter selection"""
+    # Both quantiles come from one call, over one array of the column
+    values = filtered_column(_df, _idx, col).to_numpy()
+    if len(values) == 0:
+        return np.nan, np.nan, np.nan
+    median, q99 = np.quantile(values, [0.5, 0.99])
+    return values.mean(), median, q99
+
+def histogram_figure(values, bins, title, xaxis_title):
+    """Histogram binned with NumPy and drawn server-side with matplotlib
+
+    The browser only receives a rendered image, rather than every value for
+    Plotly to bin and draw client-side.
+    """
+    # A standalone Figure needs no pyplot state and nothing to close after
+    # it is drawn
+    counts, edges = np.histogram(values, bins=bins)
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='steelblue', edgecolor='white')
+    ax.set_title(title)
+    ax.set_xlabel(xaxis_title)
+    ax.set_ylabel('Number of Papers')
+    ax.grid(axis='y', alpha=0.3)
+    fig.tight_layout()
+    return fig
+
+@st.cache_resource
+def title_index(_df):
+    """Inverted index from title words to the row positions of their titles, built once"""
+    # Words are uppercased as in pandas' case-insensitive plain-text match.
+    # Postings are stored flat: the rows of vocab[i] are rows[bounds[i]:bounds[i + 1]]
+    words = pd.Series(_df['title'].fillna('').str.upper().str.split().to_numpy()).explode().dropna()
+    codes, vocab = pd.factorize(words)
+    order = np.argsort(codes, kind='stable')
+    rows = words.index.to_numpy()[order]
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(vocab)))])
+    return pd.Series(vocab), rows, bounds
+
+def title_candidates(index, search_term):
+    """Row positions whose title could contain the search term, or None to scan every row"""
+    # Each whitespace-separated piece of the term lies inside one title word,
+    # so a matching title has, for every piece, a word containing that piece.
+    # Only the vocabulary is scanned; the rows found still need checking.
+    # One- and two-letter pieces occur in most words, so collecting their
+    # rows costs more than scanning the titles; they are left to that check
+    vocab, rows, bounds = index
+    candidates = None
+    for piece in search_term.upper().split():
+        if len(piece) < 3:
+            continue
+        hits = np.flatnonzero(vocab.str.contains(piece, regex=False).to_numpy())
+        piece_rows = np.unique(np.concatenate([rows[bounds[h]:bounds[h + 1]] for h in hits])) if len(hits) else rows[:0]
+        candidates = piece_rows if candidates is None else np.intersect1d(candidates, piece_rows, assume_unique=True)
+    return candidates
+
+def search_titles(df, idx, search_term, limit=None):
+    """Row positions of the filtered papers whose title contains the search term"""
+    # The term is matched as plain text, ignoring case. The title index
+    # narrows the filtered rows down to candidates before any title is read
+    candidates = title_candidates(title_index(df), search_term)
+    if candidates is not None:
+        idx = np.intersect1d(idx, candidates, assume_unique=True)
+
+    if limit is None:
+        titles = filtered_column(df, idx, 'title')
+        return idx[titles.str.contains(search_term, case=False, regex=False, na=False).to_numpy()]
+
+    # Only the first `limit` matches are shown, so scan the titles block by
+    # block and stop as soon as enough matches have been found
+    block_size = max(1, -(-len(idx) // 16))
+    matches = []
+    found = 0
+    for start in range(0, len(idx), block_size):
+        block = idx[start:start + block_size]
+        titles = filtered_column(df, block, 'title')
+        hits = block[titles.str.contains(search_term, case=False, regex=False, na=False).to_numpy()]
+        matches.append(hits)
+        found += len(hits)
+        if found >= limit:
+            break
+    return np.concatenate(matches)[:limit] if matches else idx[:0]
+
+# Each entry is a whole export, so only the few most recent are kept, and
+# none for longer than ten minutes
+@st.cache_data(max_entries=4, ttl=600)
+def csv_bytes(_df, _rows, filter_key, search_term):
+    """The papers at the given row positions as UTF-8 CSV, cached per filter selection and search term"""
+    # Arrow's multi-threaded writer produces the bytes directly, without
+    # first building the whole file as one Python string. It writes plain
+    # values, so categorical columns are decoded first
+    table = pa.Table.from_pandas(_df.iloc[_rows], preserve_index=False)
+    table = table.cast(pa.schema([
+        field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type) else field
+        for field in table.schema
+    ]))
+    buffer = io.BytesIO()
+    pv.write_csv(table, buffer)
+    return buffer.getvalue()
 
 def main():
     # Header
@@ -88,10 +312,19 @@ def main():
     
     # Load data
     df = load_data()
+    # Build the title search index while the data loads, not on the first search
+    title_index(df)
     
     # Sidebar filters
     st.sidebar.header("📊 Data Filters")
     
+    # Filter selections, which also identify the filtered subset for caching
+    year_range = None
+    selected_journals = []
+    include_no_abstract = True
+    # Rows kept by the filters, combined into one mask and applied once
+    mask = np.ones(len(df), dtype=bool)
+
     # Year range filter
     if 'publish_year' in df.columns:
         min_year = int(df['publish_year'].min())
@@ -102,57 +335,63 @@ def main():
             (max(2015, min_year), max_year),
             help="Filter papers by publication year"
         )
-        df_filtered = df[df['publish_year'].between(year_range[0], year_range[1])]
+        mask &= df['publish_year'].between(year_range[0], year_range[1]).to_numpy()
     else:
-        df_filtered = df
         st.sidebar.warning("No date information available")
     
     # Journal filter
     if 'journal' in df.columns:
-        top_journals = df['journal'].value_counts().head(20).index.tolist()
+        top_journals = top_journal_names(df)
         selected_journals = st.sidebar.multiselect(
             "Select Journals (optional)",
             options=top_journals,
             help="Leave empty to include all journals"
         )
         if selected_journals:
-            df_filtered = df_filtered[df_filtered['journal'].isin(selected_journals)]
+            mask &= df['journal'].isin(selected_journals).to_numpy()
     
     # Abstract filter
-    if 'has_abstract' in df_filtered.columns:
+    if 'has_abstract' in df.columns:
         include_no_abstract = st.sidebar.checkbox(
             "Include papers without abstracts",
             value=True,
             help="Uncheck to show only papers with abstracts"
         )
         if not include_no_abstract:
-            df_filtered = df_filtered[df_filtered['has_abstract'] == True]
+            mask &= df['has_abstract'].to_numpy(dtype=bool)
+    # Keep only the positions of the filtered rows; each tab gathers just the
+    # columns it reads instead of copying the whole filtered frame
+    idx = np.flatnonzero(mask)
+    filter_key = (year_range, tuple(selected_journals), include_no_abstract)
     
     # Display key metrics
     st.subheader("📈 Dataset Overview")
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Papers", f"{len(df_filtered):,}")
+        st.metric("Total Papers", f"{len(idx):,}")
     
     with col2:
-        if 'has_abstract' in df_filtered.columns:
-            papers_with_abstracts = df_filtered['has_abstract'].sum()
+        if 'has_abstract' in df.columns:
+            papers_with_abstracts = df['has_abstract'].to_numpy()[idx].sum()
             st.metric("Papers with Abstracts", f"{papers_with_abstracts:,}")
         else:
             st.metric("Papers with Abstracts", "N/A")
     
     with col3:
-        if 'journal' in df_filtered.columns:
-            unique_journals = df_filtered['journal'].nunique()
+        if 'journal' in df.columns:
+            unique_journals = len(count_journals(df, idx, filter_key))
             st.metric("Unique Journals", f"{unique_journals:,}")
         else:
             st.metric("Unique Journals", "N/A")
     
     with col4:
-        if 'publish_year' in df_filtered.columns:
-            year_span = df_filtered['publish_year'].max() - df_filtered['publish_year'].min() + 1
-            st.metric("Year Span", f"{int(year_span)} years")
+        if 'publish_year' in df.columns:
+            # The cached year counts are in year order, so their first and
+            # last years give the span without another pass over the papers
+            years = count_years(df, idx, filter_key).index
+            # An empty selection has no span to report
+            st.metric("Year Span", f"{int(years[-1] - years[0] + 1)} years" if len(years) else "N/A")
         else:
             st.metric("Year Span", "N/A")
     
@@ -168,8 +407,8 @@ def main():
     with tab1:
         st.subheader("Publications Over Time")
         
-        if 'publish_year' in df_filtered.columns:
-            year_counts = df_filtered['publish_year'].value_counts().sort_index()
+        if 'publish_year' in df.columns:
+            year_counts = count_years(df, idx, filter_key)
             
             # Interactive plotly chart
             fig = px.bar(
@@ -206,21 +445,23 @@ def main():
     with tab2:
         st.subheader("Journal Analysis")
         
-        if 'journal' in df_filtered.columns:
+        if 'journal' in df.columns:
             # Top journals
             n_journals = st.slider("Number of top journals to display", 5, 30, 15)
-            journal_counts = df_filtered['journal'].value_counts().head(n_journals)
+            journal_counts = count_journals(df, idx, filter_key).head(n_journals)
             
-            # Horizontal bar chart
-            fig = px.bar(
-                x=journal_counts.values,
-                y=journal_counts.index,
-                orientation='h',
+            # Horizontal bar chart; the counts are already aggregated, so
+            # Vega-Lite only draws one bar per journal
+            chart = alt.Chart(
+                pd.DataFrame({'journal': journal_counts.index.astype(str), 'papers': journal_counts.to_numpy()}),
                 title=f"Top {n_journals} Journals by Number of Publications",
-                labels={'x': 'Number of Papers', 'y': 'Journal'}
+                height=max(400, n_journals * 25)
+            ).mark_bar().encode(
+                x=alt.X('papers:Q', title='Number of Papers'),
+                y=alt.Y('journal:N', title='Journal', sort='-x'),
+                tooltip=['journal', 'papers']
             )
-            fig.update_layout(height=max(400, n_journals * 25))
-            st.plotly_chart(fig, use_container_width=True)
+            st.altair_chart(chart, use_container_width=True)
             
             # Journal statistics
             col1, col2 = st.columns(2)
@@ -238,16 +479,15 @@ def main():
         st.subheader("Word Frequency Analysis")
         
         # Word frequency in titles
-        if 'title' in df_filtered.columns:
+        if 'title' in df.columns:
             st.write("**Most Common Words in Paper Titles**")
             
             # Clean and analyze titles
-            all_titles = ' '.join(df_filtered['title'].apply(clean_text_for_wordfreq))
-            word_freq = Counter(all_titles.split())
+            word_freq = title_word_counts(df, idx, filter_key)
             
             # Number of words to show
             n_words = st.slider("Number of top words to display", 10, 50, 20)
-            top_words = dict(word_freq.most_common(n_words))
+            top_words = word_freq.head(n_words).to_dict()
             
             # Create bar chart
             fig = px.bar(
@@ -280,45 +520,37 @@ def main():
         
         with col1:
             # Abstract length analysis
-            if 'abstract_word_count' in df_filtered.columns:
+            if 'abstract_word_count' in df.columns:
                 st.write("**Abstract Length Distribution**")
+                abstract_word_count = filtered_column(df, idx, 'abstract_word_count').to_numpy()
+                mean_length, median_length, q99 = word_count_stats(df, idx, filter_key, 'abstract_word_count')
                 
                 # Remove extreme outliers for better visualization
-                q99 = df_filtered['abstract_word_count'].quantile(0.99)
-                filtered_abstracts = df_filtered[df_filtered['abstract_word_count'] <= q99]['abstract_word_count']
-                
-                fig = px.histogram(
-                    filtered_abstracts,
-                    nbins=30,
+                fig = histogram_figure(
+                    abstract_word_count[abstract_word_count <= q99], 30,
                     title="Distribution of Abstract Lengths (99th percentile)",
-                    labels={'value': 'Abstract Word Count', 'count': 'Number of Papers'}
+                    xaxis_title='Abstract Word Count'
                 )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                st.pyplot(fig)
                 
                 # Statistics
-                mean_length = df_filtered['abstract_word_count'].mean()
-                median_length = df_filtered['abstract_word_count'].median()
                 st.write(f"Average: **{mean_length:.1f}** words")
                 st.write(f"Median: **{median_length:.1f}** words")
         
         with col2:
             # Title length analysis
-            if 'title_word_count' in df_filtered.columns:
+            if 'title_word_count' in df.columns:
                 st.write("**Title Length Distribution**")
                 
-                fig = px.histogram(
-                    df_filtered['title_word_count'],
-                    nbins=20,
+                fig = histogram_figure(
+                    filtered_column(df, idx, 'title_word_count').to_numpy(), 20,
                     title="Distribution of Title Lengths",
-                    labels={'value': 'Title Word Count', 'count': 'Number of Papers'}
+                    xaxis_title='Title Word Count'
                 )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                st.pyplot(fig)
                 
                 # Statistics
-                mean_title_length = df_filtered['title_word_count'].mean()
-                median_title_length = df_filtered['title_word_count'].median()
+                mean_title_length, median_title_length, _ = word_count_stats(df, idx, filter_key, 'title_word_count')
                 st.write(f"Average: **{mean_title_length:.1f}** words")
                 st.write(f"Median: **{median_title_length:.1f}** words")
     
@@ -326,32 +558,38 @@ def main():
         st.subheader("Data Explorer")
         st.write("Browse the actual research papers in your filtered dataset:")
         
-        # Search functionality
-        search_term = st.text_input("🔍 Search in titles:", placeholder="Enter keywords...")
-        
-        # Apply search filter
-        display_df = df_filtered.copy()
-        if search_term:
-            mask = display_df['title'].str.contains(search_term, case=False, na=False)
-            display_df = display_df[mask]
-            st.info(f"Found {len(display_df):,} papers matching '{search_term}'")
-        
         # Select columns to display
         available_cols = ['title', 'authors', 'journal', 'publish_year', 'abstract_word_count']
-        display_cols = [col for col in available_cols if col in display_df.columns]
+        display_cols = [col for col in available_cols if col in df.columns]
         
         if display_cols:
-            # Show sample of papers
+            # Number of papers to show, chosen first so the search only has
+            # to find that many matches
             n_papers = st.slider("Number of papers to display", 10, 100, 20)
+            
+            # Search functionality
+            search_term = st.text_input("🔍 Search in titles:", placeholder="Enter keywords...")
+            
+            # Apply search filter; without a search term the filtered data is
+            # shown as is
+            display_rows = idx
+            if search_term:
+                display_rows = search_titles(df, idx, search_term, limit=n_papers)
+                st.info(f"Showing {len(display_rows):,} papers matching '{search_term}'")
+            
+            # Show sample of papers
             st.dataframe(
-                display_df[display_cols].head(n_papers),
+                df.iloc[display_rows[:n_papers]][display_cols],
                 use_container_width=True,
                 height=400
             )
             
-            # Download filtered data
+            # Download filtered data; only now are all matches searched for
             if st.button("📥 Download Filtered Data as CSV"):
-                csv = display_df.to_csv(index=False)
+                if search_term:
+                    display_rows = search_titles(df, idx, search_term)
+                    st.info(f"Found {len(display_rows):,} papers matching '{search_term}'")
+                csv = csv_bytes(df, display_rows, filter_key, search_term)
                 st.download_button(
                     label="Download CSV",
                     data=csv,